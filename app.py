@@ -9,11 +9,13 @@ from werkzeug.utils import secure_filename
 from db import close_db, get_db, init_db
 
 
-def create_app():
+def create_app(test_config=None):
     app = Flask(__name__)
     app.config["SECRET_KEY"] = "dev"
     app.config["DATABASE"] = os.path.join(app.root_path, "dreams.db")
     app.config["UPLOAD_FOLDER"] = os.path.join(app.root_path, "static", "uploads")
+    if test_config is not None:
+        app.config.update(test_config)
     os.makedirs(app.config["UPLOAD_FOLDER"], exist_ok=True)
 
     @app.teardown_appcontext
@@ -27,6 +27,7 @@ def init_db():
         with open(schema_path, "r", encoding="utf-8") as f:
             db.executescript(f.read())
         ensure_dream_columns(db)
+        ensure_dream_indexes(db)
         normalize_image_paths(db)
 
 
@@ -51,6 +52,39 @@ def ensure_dream_columns(db):
             db.execute(f"ALTER TABLE dreams ADD COLUMN {column} {col_type}")
 
 
+def ensure_dream_indexes(db):
+    desired = {
+        "idx_dreams_date_created": (
+            "date",
+            "created_at",
+            "title",
+            "mood",
+            "vividness",
+            "sleep_minutes",
+            "image_path",
+        ),
+        "idx_dreams_date_stats": (
+            "date",
+            "mood",
+            "fatigue",
+            "sleep_minutes",
+            "location",
+            "people",
+            "thing",
+            "color",
+            "smell",
+        ),
+    }
+    for name, columns in desired.items():
+        cursor = db.execute(f"PRAGMA index_info({name})")
+        existing = tuple(row[2] for row in cursor.fetchall())
+        if existing == columns:
+            continue
+        if existing:
+            db.execute(f"DROP INDEX {name}")
+        db.execute(f"CREATE INDEX {name} ON dreams ({', '.join(columns)})")
+
+
 def normalize_image_paths(db):
     db.execute(
         """
@@ -0,0 +1,152 @@
+import re
+import sqlite3
+from contextlib import closing
+
+import pytest
+from flask import g
+
+from app import create_app
+from db import get_db
+
+PLAN_TABLE = re.compile(r"^(SCAN|SEARCH) TABLE (\w+)(?: AS (\w+))?")
+
+ALLOWED_SCANS = {
+    "/search": {"SCAN d USING INDEX idx_dreams_date_created"},
+    "/search?q=sea": {"SCAN d USING INDEX idx_dreams_date_created"},
+    "/stats": {
+        "SCAN d USING COVERING INDEX idx_dreams_date_created",
+        "SCAN d USING COVERING INDEX idx_dreams_date_stats",
+    },
+    "/tags": {"SCAN dreams USING COVERING INDEX idx_dreams_date_stats"},
+}
+
+ROUTE_REQUESTS = [
+    ("GET", "/dreams", {}),
+    ("GET", "/dreams?ym=2024-02", {}),
+    ("GET", "/search", {}),
+    ("GET", "/search?q=sea", {}),
+    ("GET", "/search?from=2024-01-01", {}),
+    ("GET", "/search?to=2024-12-31", {}),
+    ("GET", "/search?from=2024-01-01&to=2024-12-31", {}),
+    ("GET", "/search?q=sea&from=2024-01-01&to=2024-12-31&tag=cat,blue", {}),
+    ("GET", "/stats", {}),
+    ("GET", "/stats?from=2024-01-01", {}),
+    ("GET", "/stats?to=2024-12-31", {}),
+    ("GET", "/stats?from=2024-01-01&to=2024-12-31", {}),
+    ("GET", "/tags", {}),
+    ("GET", "/dreams/1", {}),
+    ("GET", "/dreams/1/edit", {}),
+    ("POST", "/dreams/1/edit", {"title": "edited", "body": "edited", "date": "2024-02-11"}),
+    ("POST", "/dreams/new", {"title": "new", "body": "new", "date": "2024-02-12"}),
+    ("POST", "/dreams/1/delete", {}),
+]
+
+
+class RecordingConnection:
+    def __init__(self, db, statements):
+        self.db = db
+        self.statements = statements
+
+    def execute(self, sql, params=()):
+        self.statements.append((sql, params))
+        return self.db.execute(sql, params)
+
+    def __getattr__(self, name):
+        return getattr(self.db, name)
+
+
+@pytest.fixture
+def app(tmp_path):
+    app = create_app(
+        {
+            "TESTING": True,
+            "DATABASE": str(tmp_path / "dreams.db"),
+            "UPLOAD_FOLDER": str(tmp_path / "uploads"),
+        }
+    )
+    app.config["STATEMENTS"] = []
+
+    @app.before_request
+    def record_statements():
+        g.db = RecordingConnection(get_db(), app.config["STATEMENTS"])
+
+    app.test_client().post(
+        "/dreams/new",
+        data={
+            "title": "sea",
+            "body": "a cat by the blue sea",
+            "date": "2024-02-10",
+            "location": "beach",
+            "thing": "cat",
+            "color": "blue",
+            "mood": "1",
+            "fatigue": "2",
+            "sleep_start": "23:00",
+            "sleep_end": "07:00",
+        },
+    )
+    app.config["STATEMENTS"].clear()
+    return app
+
+
+def normalize_plan_detail(detail):
+    return PLAN_TABLE.sub(lambda m: f"{m[1]} {m[3] or m[2]}", detail)
+
+
+def query_plan(db_path, sql, params):
+    with closing(sqlite3.connect(db_path)) as db:
+        return [
+            normalize_plan_detail(row[3])
+            for row in db.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+        ]
+
+
+@pytest.mark.parametrize(("method", "path", "data"), ROUTE_REQUESTS)
+def test_route_queries_avoid_full_scans_and_temp_sorts(app, method, path, data):
+    client = app.test_client()
+    response = client.open(path, method=method, data=data)
+    assert response.status_code in (200, 302)
+
+    statements = [
+        (sql, params)
+        for sql, params in app.config["STATEMENTS"]
+        if sql.lstrip().split(None, 1)[0].upper() in {"SELECT", "INSERT", "UPDATE", "DELETE"}
+    ]
+    assert statements
+
+    for sql, params in statements:
+        plan = query_plan(app.config["DATABASE"], sql, params)
+        for detail in plan:
+            if detail.startswith("SCAN "):
+                assert detail in ALLOWED_SCANS.get(path, set()), f"full scan: {detail}\n{sql}"
+            assert "TEMP B-TREE" not in detail, f"temp sort: {detail}\n{sql}"
+
+
+def test_indexes_synced_for_legacy_schema(tmp_path):
+    db_path = tmp_path / "dreams.db"
+    with closing(sqlite3.connect(db_path)) as db:
+        db.execute(
+            """
+            CREATE TABLE dreams (
+                dream_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                date TEXT,
+                title TEXT NOT NULL,
+                body TEXT NOT NULL,
+                mood INTEGER,
+                vividness INTEGER,
+                created_at TEXT,
+                updated_at TEXT
+            )
+            """
+        )
+        db.execute("CREATE INDEX idx_dreams_date_created ON dreams (date)")
+        db.commit()
+    create_app({"DATABASE": str(db_path), "UPLOAD_FOLDER": str(tmp_path / "uploads")})
+
+    with closing(sqlite3.connect(db_path)) as db:
+        created = [
+            row[2] for row in db.execute("PRAGMA index_info(idx_dreams_date_created)")
+        ]
+        stats = [row[2] for row in db.execute("PRAGMA index_info(idx_dreams_date_stats)")]
+    assert created[:2] == ["date", "created_at"]
+    assert "smell" in stats